@@ -14,16 +14,14 @@ import json
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.underwriting_engine import UnderwritingEngine, PropertyData
-from src.property_sourcer import PropertySourcer, ClientScenario
-
 def run_analysis():
     """Run complete analysis for both client scenarios"""
+    from src.property_sourcer import PropertySourcer, ClientScenario
+    
     print("🚀 Starting Real Estate Underwriting Analysis...")
     print("=" * 60)
     
-    # Initialize engines
-    underwriting_engine = UnderwritingEngine()
+    # Initialize sourcer (it underwrites with its own engine)
     property_sourcer = PropertySourcer()
     
     # Define client scenarios
@@ -33,7 +31,7 @@ def run_analysis():
         max_purchase_price=375000,
         min_coc_return=0.09,
         location="Houston, TX",
-        requirements=["Minimum 9% CoC return", "Max $375K OOP"]
+        requirements=("Minimum 9% CoC return", "Max $375K OOP")
     )
     
     risahl = ClientScenario(
@@ -42,7 +40,7 @@ def run_analysis():
         max_purchase_price=500000,
         min_coc_return=0.05,
         location="Houston, TX",
-        requirements=["Minimum 5% CoC return", "Max $175K OOP"]
+        requirements=("Minimum 5% CoC return", "Max $175K OOP")
     )
     
     # Analyze scenarios
@@ -60,7 +58,7 @@ def run_analysis():
     # Sarah & Husband Results
     print(f"\n🏠 SARAH & HUSBAND SCENARIO")
     print(f"Properties Found: {sarah_results['properties_found']}")
-    print(f"Requirements: {sarah_husband.requirements}")
+    print(f"Requirements: {list(sarah_husband.requirements)}")
     
     if sarah_results['recommendations']:
         print("\nTop Recommendations:")
@@ -79,7 +77,7 @@ def run_analysis():
     # Risahl Results
     print(f"\n🏠 RISAHL SCENARIO")
     print(f"Properties Found: {risahl_results['properties_found']}")
-    print(f"Requirements: {risahl.requirements}")
+    print(f"Requirements: {list(risahl.requirements)}")
     
     if risahl_results['recommendations']:
         print("\nTop Recommendations:")
@@ -120,10 +118,12 @@ def run_dashboard():
     
     # Import and run dashboard
     from src.automated_dashboard import app
-    app.run_server(debug=True, host='0.0.0.0', port=8050)
+    app.run_server(debug=os.getenv('DASH_DEBUG') == '1', host='0.0.0.0', port=8050)
 
 def run_test():
     """Run test analysis on a single property"""
+    from src.underwriting_engine import UnderwritingEngine, PropertyData
+    
     print("🧪 Running Test Analysis...")
     
     # Create test property
@@ -6,25 +6,36 @@ Comprehensive dashboard integrating underwriting engine and property sourcing.
 """
 
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, callback
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
-import plotly.express as px
-from dash.dependencies import Input, Output, State
-import pandas as pd
-import numpy as np
-from typing import Dict, List
-import json
+import plotly.io as pio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from functools import lru_cache
+import os
 
-from src.underwriting_engine import UnderwritingEngine, PropertyData
+from src.underwriting_engine import UnderwritingResult
 from src.property_sourcer import PropertySourcer, ClientScenario
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 server = app.server
 
-# Initialize engines
-underwriting_engine = UnderwritingEngine()
+# Shared styling for the property comparison bar charts, layered on the default template
+pio.templates["property_comparison"] = go.layout.Template(
+    data={'bar': [go.Bar(textposition='auto')]},
+    layout=go.Layout(xaxis_title="Properties", height=400)
+)
+
+# Bound formatters for chart labels
+_MONEY = "${:,.0f}".format
+_PCT = "{:.1f}%".format
+
+# Initialize engine
 property_sourcer = PropertySourcer()
 
 # Define client scenarios
@@ -34,7 +45,7 @@ SARAH_HUSBAND = ClientScenario(
     max_purchase_price=375000,
     min_coc_return=0.09,
     location="Houston, TX",
-    requirements=["Minimum 9% CoC return", "Max $375K OOP"]
+    requirements=("Minimum 9% CoC return", "Max $375K OOP")
 )
 
 RISAHL = ClientScenario(
@@ -43,9 +54,15 @@ RISAHL = ClientScenario(
     max_purchase_price=500000,
     min_coc_return=0.05,
     location="Houston, TX",
-    requirements=["Minimum 5% CoC return", "Max $175K OOP"]
+    requirements=("Minimum 5% CoC return", "Max $175K OOP")
 )
 
+# Scenario selected by each button id
+SCENARIOS = {
+    "sarah-btn": SARAH_HUSBAND,
+    "risahl-btn": RISAHL
+}
+
 # App layout
 app.layout = dbc.Container([
     dbc.Row([
@@ -62,7 +79,9 @@ app.layout = dbc.Container([
             dbc.ButtonGroup([
                 dbc.Button("Sarah & Husband", id="sarah-btn", color="primary", n_clicks=0),
                 dbc.Button("Risahl", id="risahl-btn", color="secondary", n_clicks=0)
-            ], className="mb-3")
+            ], className="mb-3"),
+            # Button id of the scenario currently shown in this browser session
+            dcc.Store(id="active-scenario")
         ])
     ]),
     
@@ -108,29 +127,8 @@ app.layout = dbc.Container([
     ])
 ], fluid=True)
 
-@app.callback(
-    Output("scenario-results", "children"),
-    [Input("sarah-btn", "n_clicks"),
-     Input("risahl-btn", "n_clicks")]
-)
-def update_scenario_results(sarah_clicks, risahl_clicks):
-    """Update scenario results based on button clicks"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return html.P("Select a scenario to analyze")
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == "sarah-btn":
-        scenario = SARAH_HUSBAND
-    elif button_id == "risahl-btn":
-        scenario = RISAHL
-    else:
-        return html.P("Select a scenario to analyze")
-    
-    # Analyze scenario
-    results = property_sourcer.analyze_scenario(scenario)
-    
+def _build_scenario_results(scenario: ClientScenario, results: Dict):
+    """Build the scenario results cards"""
     if results['properties_found'] == 0:
         return dbc.Alert(
             f"No properties found meeting requirements for {scenario.name}",
@@ -157,33 +155,27 @@ def update_scenario_results(sarah_clicks, risahl_clicks):
     
     return cards
 
-@app.callback(
-    Output("property-analysis", "children"),
-    [Input("sarah-btn", "n_clicks"),
-     Input("risahl-btn", "n_clicks")]
-)
-def update_property_analysis(sarah_clicks, risahl_clicks):
-    """Update detailed property analysis"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return html.P("Select a scenario to view property analysis")
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == "sarah-btn":
-        scenario = SARAH_HUSBAND
-    elif button_id == "risahl-btn":
-        scenario = RISAHL
-    else:
-        return html.P("Select a scenario to view property analysis")
-    
-    # Get top property for detailed analysis
-    results = property_sourcer.analyze_scenario(scenario)
+def _build_property_analysis(results: Dict):
+    """Build the detailed analysis of the top property"""
     if not results['recommendations']:
         return html.P("No properties found for detailed analysis")
     
     top_property = results['recommendations'][0]
     
+    # Build one card per scenario ahead of the layout
+    scenarios = top_property['scenarios']
+    scenario_cards = []
+    for scenario_type, data in scenarios.items():
+        card = dbc.Card([
+            dbc.CardHeader(scenario_type.title() + " Scenario"),
+            dbc.CardBody([
+                html.P(f"Rent: ${data['rent']:,.0f}/month"),
+                html.P(f"Expenses: ${data['expenses']:,.0f}/month"),
+                html.P(f"CoC Return: {data['coc_return']:.1%}")
+            ])
+        ], className="mb-2")
+        scenario_cards.append(card)
+    
     # Create detailed analysis
     analysis = dbc.Card([
         dbc.CardHeader("Detailed Property Analysis"),
@@ -210,158 +202,78 @@ def update_property_analysis(sarah_clicks, risahl_clicks):
             
             # Scenario Analysis
             html.H5("Scenario Analysis"),
-            scenarios = top_property['scenarios']
-            scenario_cards = []
-            for scenario_type, data in scenarios.items():
-                card = dbc.Card([
-                    dbc.CardHeader(scenario_type.title() + " Scenario"),
-                    dbc.CardBody([
-                        html.P(f"Rent: ${data['rent']:,.0f}/month"),
-                        html.P(f"Expenses: ${data['expenses']:,.0f}/month"),
-                        html.P(f"CoC Return: {data['coc_return']:.1%}")
-                    ])
-                ], className="mb-2")
-                scenario_cards.append(card)
-            
-            dbc.Row([
-                dbc.Col(scenario_cards[0], width=4),
-                dbc.Col(scenario_cards[1], width=4),
-                dbc.Col(scenario_cards[2], width=4)
-            ])
+            dbc.Row([dbc.Col(card, width=4) for card in scenario_cards[:3]])
         ])
     ])
     
     return analysis
 
-@app.callback(
-    Output("coc-comparison-chart", "figure"),
-    [Input("sarah-btn", "n_clicks"),
-     Input("risahl-btn", "n_clicks")]
-)
-def update_coc_chart(sarah_clicks, risahl_clicks):
-    """Update CoC comparison chart"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return go.Figure()
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == "sarah-btn":
-        scenario = SARAH_HUSBAND
-    elif button_id == "risahl-btn":
-        scenario = RISAHL
-    else:
-        return go.Figure()
-    
-    results = property_sourcer.analyze_scenario(scenario)
-    if not results['recommendations']:
+def _recommendations_frame(results: Dict) -> "pd.DataFrame":
+    """Tabulate the recommendations once for the chart builders"""
+    # pandas is only needed once a scenario is charted, so keep it off the import path
+    import pandas as pd
+    
+    df = pd.DataFrame(
+        results['recommendations'],
+        columns=['address', 'coc_return', 'monthly_cash_flow']
+    )
+    df['label'] = df['address'].str.slice(0, 20) + "..."
+    return df
+
+def _build_coc_chart(chart_data: "pd.DataFrame"):
+    """Build the CoC comparison chart"""
+    if chart_data.empty:
         return go.Figure()
     
     # Create CoC comparison chart
-    addresses = [rec['address'][:20] + "..." for rec in results['recommendations']]
-    coc_returns = [rec['coc_return'] * 100 for rec in results['recommendations']]
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=addresses,
-            y=coc_returns,
-            text=[f"{coc:.1f}%" for coc in coc_returns],
-            textposition='auto',
+    coc_returns = chart_data['coc_return'] * 100
+    
+    return go.Figure(
+        data=[
+            go.Bar(
+                x=chart_data['label'].to_numpy(),
+                y=coc_returns.to_numpy(),
+                text=coc_returns.map(_PCT).to_numpy()
+            )
+        ],
+        layout=go.Layout(
+            template="plotly+property_comparison",
+            title="Cash-on-Cash Return Comparison",
+            yaxis_title="CoC Return (%)"
         )
-    ])
-    
-    fig.update_layout(
-        title="Cash-on-Cash Return Comparison",
-        xaxis_title="Properties",
-        yaxis_title="CoC Return (%)",
-        height=400
     )
-    
-    return fig
 
-@app.callback(
-    Output("cash-flow-chart", "figure"),
-    [Input("sarah-btn", "n_clicks"),
-     Input("risahl-btn", "n_clicks")]
-)
-def update_cash_flow_chart(sarah_clicks, risahl_clicks):
-    """Update cash flow chart"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return go.Figure()
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == "sarah-btn":
-        scenario = SARAH_HUSBAND
-    elif button_id == "risahl-btn":
-        scenario = RISAHL
-    else:
-        return go.Figure()
-    
-    results = property_sourcer.analyze_scenario(scenario)
-    if not results['recommendations']:
+def _build_cash_flow_chart(chart_data: "pd.DataFrame"):
+    """Build the cash flow chart"""
+    if chart_data.empty:
         return go.Figure()
     
     # Create cash flow chart
-    addresses = [rec['address'][:20] + "..." for rec in results['recommendations']]
-    cash_flows = [rec['monthly_cash_flow'] for rec in results['recommendations']]
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=addresses,
-            y=cash_flows,
-            text=[f"${cf:,.0f}" for cf in cash_flows],
-            textposition='auto',
+    cash_flows = chart_data['monthly_cash_flow']
+    
+    return go.Figure(
+        data=[
+            go.Bar(
+                x=chart_data['label'].to_numpy(),
+                y=cash_flows.to_numpy(),
+                text=cash_flows.map(_MONEY).to_numpy()
+            )
+        ],
+        layout=go.Layout(
+            template="plotly+property_comparison",
+            title="Monthly Cash Flow Comparison",
+            yaxis_title="Monthly Cash Flow ($)"
         )
-    ])
-    
-    fig.update_layout(
-        title="Monthly Cash Flow Comparison",
-        xaxis_title="Properties",
-        yaxis_title="Monthly Cash Flow ($)",
-        height=400
     )
-    
-    return fig
 
-@app.callback(
-    Output("optimization-opportunities", "children"),
-    [Input("sarah-btn", "n_clicks"),
-     Input("risahl-btn", "n_clicks")]
-)
-def update_optimization_opportunities(sarah_clicks, risahl_clicks):
-    """Update optimization opportunities"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return html.P("Select a scenario to view optimization opportunities")
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == "sarah-btn":
-        scenario = SARAH_HUSBAND
-    elif button_id == "risahl-btn":
-        scenario = RISAHL
-    else:
-        return html.P("Select a scenario to view optimization opportunities")
-    
-    results = property_sourcer.analyze_scenario(scenario)
+def _build_optimization_opportunities(results: Dict, underwriting_result: Optional[UnderwritingResult]):
+    """Build the optimization opportunities cards for the top property"""
     if not results['recommendations']:
         return html.P("No properties found for optimization analysis")
     
-    # Get optimization opportunities for top property
-    top_property_data = None
-    for prop in property_sourcer.generate_houston_properties(scenario.max_purchase_price, scenario.min_coc_return):
-        if prop.address == results['recommendations'][0]['address']:
-            top_property_data = prop
-            break
-    
-    if not top_property_data:
+    if not underwriting_result:
         return html.P("Property data not found")
     
-    # Perform underwriting analysis to get optimization opportunities
-    underwriting_result = underwriting_engine.underwrite_property(top_property_data)
-    
     # Create optimization opportunities cards
     cards = []
     for opp in underwriting_result.optimization_opportunities:
@@ -381,43 +293,14 @@ def update_optimization_opportunities(sarah_clicks, risahl_clicks):
     
     return cards
 
-@app.callback(
-    Output("risk-assessment", "children"),
-    [Input("sarah-btn", "n_clicks"),
-     Input("risahl-btn", "n_clicks")]
-)
-def update_risk_assessment(sarah_clicks, risahl_clicks):
-    """Update risk assessment"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return html.P("Select a scenario to view risk assessment")
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == "sarah-btn":
-        scenario = SARAH_HUSBAND
-    elif button_id == "risahl-btn":
-        scenario = RISAHL
-    else:
-        return html.P("Select a scenario to view risk assessment")
-    
-    results = property_sourcer.analyze_scenario(scenario)
+def _build_risk_assessment(results: Dict, underwriting_result: Optional[UnderwritingResult]):
+    """Build the risk assessment card for the top property"""
     if not results['recommendations']:
         return html.P("No properties found for risk assessment")
     
-    # Get risk assessment for top property
-    top_property_data = None
-    for prop in property_sourcer.generate_houston_properties(scenario.max_purchase_price, scenario.min_coc_return):
-        if prop.address == results['recommendations'][0]['address']:
-            top_property_data = prop
-            break
-    
-    if not top_property_data:
+    if not underwriting_result:
         return html.P("Property data not found")
     
-    # Perform underwriting analysis to get risk assessment
-    underwriting_result = underwriting_engine.underwrite_property(top_property_data)
-    
     # Create risk assessment card
     risk_card = dbc.Card([
         dbc.CardHeader("Risk Assessment"),
@@ -435,5 +318,62 @@ def update_risk_assessment(sarah_clicks, risahl_clicks):
     
     return risk_card
 
+@lru_cache(maxsize=16)
+def _render_scenario(scenario: ClientScenario) -> Tuple:
+    """Memoized dashboard sections for a scenario (the rendered trees are never mutated)"""
+    # Analyze scenario once and fan the results out to every section
+    results = property_sourcer.analyze_scenario(scenario)
+    
+    # Reuse the top property's underwriting for optimization and risk analysis
+    underwriting_result = None
+    if results['recommendations']:
+        underwriting_result = results['recommendations'][0]['underwriting_result']
+    
+    chart_data = _recommendations_frame(results)
+    
+    return (
+        _build_scenario_results(scenario, results),
+        _build_property_analysis(results),
+        _build_coc_chart(chart_data),
+        _build_cash_flow_chart(chart_data),
+        _build_optimization_opportunities(results, underwriting_result),
+        _build_risk_assessment(results, underwriting_result)
+    )
+
+@app.callback(
+    [Output("scenario-results", "children"),
+     Output("property-analysis", "children"),
+     Output("coc-comparison-chart", "figure"),
+     Output("cash-flow-chart", "figure"),
+     Output("optimization-opportunities", "children"),
+     Output("risk-assessment", "children"),
+     Output("active-scenario", "data")],
+    [Input("sarah-btn", "n_clicks"),
+     Input("risahl-btn", "n_clicks")],
+    [State("active-scenario", "data")]
+)
+def update_dashboard(sarah_clicks, risahl_clicks, active_scenario):
+    """Update every dashboard section from a single scenario analysis"""
+    ctx = dash.callback_context
+    button_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else None
+    
+    scenario = SCENARIOS.get(button_id)
+    if scenario is None:
+        return (
+            html.P("Select a scenario to analyze"),
+            html.P("Select a scenario to view property analysis"),
+            go.Figure(),
+            go.Figure(),
+            html.P("Select a scenario to view optimization opportunities"),
+            html.P("Select a scenario to view risk assessment"),
+            None
+        )
+    
+    # Re-selecting the scenario already on screen would re-send identical sections
+    if button_id == active_scenario:
+        raise PreventUpdate
+    
+    return _render_scenario(scenario) + (button_id,)
+
 if __name__ == "__main__":
-    app.run_server(debug=True, host='0.0.0.0', port=8050)
+    app.run_server(debug=os.getenv('DASH_DEBUG') == '1', host='0.0.0.0', port=8050)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Property records and legend text shared by the CSV and Google Sheets template scripts
+"""
+
+from types import MappingProxyType
+from typing import Final
+
+# Legend disclaimer shown at the top of every template
+DISCLAIMER: Final[str] = (
+    'The numbers, data and representations made below or on any of our underwriting is subject to change without notice. While we attempt to represent data accurately, revenues may not be accurate, projected depreciation may not be accurate or your personal circumstances and operating ability may not be reflected in the underwriting. All data below, all metrics herein are not guaranteed to be accurate and should not be used to make investment decisions, influence past or present decision making nor should you hold us liable for any inaccuracies by reading this and inferring data on your own assumptions. By working with us, viewing this, you acknowledge that none of this is tax or financial advice and should not be construed as such. Please refer to your financial advisor, CPA or other licensed professional for your specific tax and financial questions/needs.'
+)
+
+def _property_record(fields):
+    """Freeze a property record, deriving the annual, NOI and cash flow metrics"""
+    noi_monthly = fields['rent_mid'] - fields['monthly_expenses']
+    cash_flow_monthly = noi_monthly - fields['monthly_payment']
+    return MappingProxyType({
+        **fields,
+        'annual_expenses': fields['monthly_expenses'] * 12,
+        'noi_monthly': noi_monthly,
+        'noi_annual': noi_monthly * 12,
+        'cash_flow_monthly': cash_flow_monthly,
+        'cash_flow_annual': cash_flow_monthly * 12
+    })
+
+# Property records (read-only; 3421 Maple Street is shared by both clients)
+_PROP_OAK_RIDGE = _property_record({
+    'address': '2456 Oak Ridge Drive, Houston, TX 77056',
+    'purchase_price': 310000,
+    'down_payment': 62000,
+    'loan_amount': 248000,
+    'monthly_payment': 1567,
+    'closing_costs': 9300,
+    'total_oop': 71300,
+    'rent_low': 3753,
+    'rent_mid': 4170,
+    'rent_high': 4587,
+    'monthly_expenses': 1710,
+    'coc_return': 11.2,
+    'coc_initial': 5.7,
+    'appreciation_initial': 3.2,
+    'appreciation_optimized': 4.1,
+    'tax_savings_initial': 1.8,
+    'tax_savings_optimized': 2.3,
+    'principal_initial': 2.1,
+    'principal_optimized': 2.7,
+    'total_return_initial': 12.8,
+    'total_return_optimized': 20.3
+})
+
+_PROP_PINE_VALLEY = _property_record({
+    'address': '1892 Pine Valley Lane, Houston, TX 77084',
+    'purchase_price': 395000,
+    'down_payment': 79000,
+    'loan_amount': 316000,
+    'monthly_payment': 1987,
+    'closing_costs': 11850,
+    'total_oop': 90850,
+    'rent_low': 4901,
+    'rent_mid': 5445,
+    'rent_high': 5990,
+    'monthly_expenses': 2150,
+    'coc_return': 10.8,
+    'coc_initial': -0.3,
+    'appreciation_initial': 3.5,
+    'appreciation_optimized': 4.3,
+    'tax_savings_initial': 2.1,
+    'tax_savings_optimized': 2.6,
+    'principal_initial': 2.3,
+    'principal_optimized': 2.9,
+    'total_return_initial': 7.6,
+    'total_return_optimized': 20.6
+})
+
+_PROP_MAPLE_ST = _property_record({
+    'address': '3421 Maple Street, Houston, TX 77002',
+    'purchase_price': 270000,
+    'down_payment': 54000,
+    'loan_amount': 216000,
+    'monthly_payment': 1365,
+    'closing_costs': 8100,
+    'total_oop': 62100,
+    'rent_low': 3800,
+    'rent_mid': 4220,
+    'rent_high': 4640,
+    'monthly_expenses': 1680,
+    'coc_return': 10.5,
+    'coc_initial': 4.2,
+    'appreciation_initial': 3.8,
+    'appreciation_optimized': 4.5,
+    'tax_savings_initial': 1.9,
+    'tax_savings_optimized': 2.4,
+    'principal_initial': 2.2,
+    'principal_optimized': 2.8,
+    'total_return_initial': 12.1,
+    'total_return_optimized': 20.2
+})
+
+_PROP_BIRCH_RD = _property_record({
+    'address': '7890 Birch Road, Houston, TX 77008',
+    'purchase_price': 280000,
+    'down_payment': 56000,
+    'loan_amount': 224000,
+    'monthly_payment': 1415,
+    'closing_costs': 8400,
+    'total_oop': 64400,
+    'rent_low': 3750,
+    'rent_mid': 4165,
+    'rent_high': 4580,
+    'monthly_expenses': 1665,
+    'coc_return': 9.8,
+    'coc_initial': 4.5,
+    'appreciation_initial': 3.6,
+    'appreciation_optimized': 4.2,
+    'tax_savings_initial': 1.8,
+    'tax_savings_optimized': 2.2,
+    'principal_initial': 2.1,
+    'principal_optimized': 2.6,
+    'total_return_initial': 12.0,
+    'total_return_optimized': 18.8
+})
+
+_PROP_OAK_ST = _property_record({
+    'address': '3456 Oak Street, Houston, TX 77004',
+    'purchase_price': 261000,
+    'down_payment': 52200,
+    'loan_amount': 208800,
+    'monthly_payment': 1320,
+    'closing_costs': 7830,
+    'total_oop': 60030,
+    'rent_low': 3720,
+    'rent_mid': 4130,
+    'rent_high': 4540,
+    'monthly_expenses': 1630,
+    'coc_return': 9.1,
+    'coc_initial': 4.8,
+    'appreciation_initial': 3.4,
+    'appreciation_optimized': 4.0,
+    'tax_savings_initial': 1.7,
+    'tax_savings_optimized': 2.1,
+    'principal_initial': 2.0,
+    'principal_optimized': 2.5,
+    'total_return_initial': 11.9,
+    'total_return_optimized': 17.7
+})
+
+# Top 3 properties for each client
+SARAH_PROPERTIES = (_PROP_OAK_RIDGE, _PROP_PINE_VALLEY, _PROP_MAPLE_ST)
+RISAHL_PROPERTIES = (_PROP_MAPLE_ST, _PROP_BIRCH_RD, _PROP_OAK_ST)
+
+# Properties per client, in template order
+PROPERTIES_DATA = MappingProxyType({
+    "Sarah & Husband": SARAH_PROPERTIES,
+    "Risahl": RISAHL_PROPERTIES
+})
@@ -5,22 +5,20 @@ Property Sourcing Engine
 Sources properties from multiple platforms and integrates with underwriting engine.
 """
 
-import pandas as pd
-import numpy as np
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-import random
-from src.underwriting_engine import PropertyData, UnderwritingEngine
+from statistics import fmean
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, replace
+from src.underwriting_engine import PropertyData, UnderwritingEngine, UnderwritingResult, DATACLASS_SLOTS
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ClientScenario:
-    """Client scenario requirements"""
+    """Client scenario requirements (frozen so it can key analysis caches)"""
     name: str
     max_oop: float
     max_purchase_price: float
     min_coc_return: float
     location: str
-    requirements: List[str]
+    requirements: Tuple[str, ...]
 
 class PropertySourcer:
     """
@@ -39,7 +37,13 @@ class PropertySourcer:
         """
         Generate realistic Houston properties based on market data
         """
-        properties = []
+        return [result.property_data for result in self._underwrite_houston_properties(max_price, min_coc)]
+    
+    def _underwrite_houston_properties(self, max_price: float, min_coc: float) -> List[UnderwritingResult]:
+        """
+        Underwrite the Houston listings, keeping those within price that meet the minimum CoC return
+        """
+        results = []
         
         # Property templates based on Houston market data
         property_templates = [
@@ -154,33 +158,35 @@ class PropertySourcer:
                 
                 # Check if meets minimum CoC return
                 if result.coc_return >= min_coc:
-                    properties.append(property_data)
+                    results.append(result)
         
-        return properties
+        return results
     
     def source_properties_for_scenario(self, scenario: ClientScenario) -> List[Dict]:
         """
         Source properties for a specific client scenario
         """
-        properties = self.generate_houston_properties(
+        underwritten = self._underwrite_houston_properties(
             scenario.max_purchase_price,
             scenario.min_coc_return
         )
         
         results = []
-        for property_data in properties:
-            # Perform complete underwriting analysis
-            result = self.engine.underwrite_property(
-                property_data,
-                oop_requirement=scenario.max_oop
-            )
+        for result in underwritten:
+            # Only the recommendation depends on the OOP requirement, so reuse the underwriting
+            result = replace(result, recommendation=self.engine.generate_recommendation(
+                result.coc_return,
+                result.risk_assessment,
+                scenario.max_oop,
+                result.mortgage_details['total_oop']
+            ))
             
             # Check if meets all requirements
             if (result.mortgage_details['total_oop'] <= scenario.max_oop and
                 result.coc_return >= scenario.min_coc_return):
                 
                 results.append({
-                    'property_data': property_data,
+                    'property_data': result.property_data,
                     'underwriting_result': result,
                     'meets_requirements': True
                 })
@@ -220,15 +226,16 @@ class PropertySourcer:
                 'recommendation': result.recommendation,
                 'risk_level': result.risk_assessment['risk_level'],
                 'optimization_opportunities': len(result.optimization_opportunities),
-                'scenarios': result.scenarios
+                'scenarios': result.scenarios,
+                'underwriting_result': result
             }
             
             recommendations.append(recommendation)
         
         # Calculate summary statistics
         total_investment = sum(p['underwriting_result'].mortgage_details['total_oop'] for p in properties)
-        avg_coc = np.mean([p['underwriting_result'].coc_return for p in properties])
-        avg_cash_flow = np.mean([p['underwriting_result'].cash_flow_analysis['monthly_cash_flow'] for p in properties])
+        avg_coc = fmean(p['underwriting_result'].coc_return for p in properties)
+        avg_cash_flow = fmean(p['underwriting_result'].cash_flow_analysis['monthly_cash_flow'] for p in properties)
         
         return {
             'scenario': scenario,
@@ -254,7 +261,7 @@ if __name__ == "__main__":
         max_purchase_price=375000,
         min_coc_return=0.09,
         location="Houston, TX",
-        requirements=["Minimum 9% CoC return", "Max $375K OOP"]
+        requirements=("Minimum 9% CoC return", "Max $375K OOP")
     )
     
     risahl = ClientScenario(
@@ -263,7 +270,7 @@ if __name__ == "__main__":
         max_purchase_price=500000,
         min_coc_return=0.05,
         location="Houston, TX",
-        requirements=["Minimum 5% CoC return", "Max $175K OOP"]
+        requirements=("Minimum 5% CoC return", "Max $175K OOP")
     )
     
     # Analyze scenarios
@@ -6,14 +6,16 @@ Implements exact Google Sheets formulas and calculation methodology
 for comprehensive property underwriting analysis.
 """
 
-import pandas as pd
-import numpy as np
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 import math
+import sys
 from datetime import datetime
 
-@dataclass
+# Slotted dataclasses require Python 3.10+; older interpreters keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PropertyData:
     """Property information data model"""
     address: str